@@ -18,15 +18,20 @@ from __future__ import annotations
 import json
 import logging
 import os
+import sys
 import time
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from tenacity import Retrying, stop_after_attempt, wait_random, retry_if_exception
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an install requirement
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +43,18 @@ APPLICATION_ENV_VAR = "APPCONFIG_APPLICATION_ID"
 ENVIRONMENT_ENV_VAR = "APPCONFIG_ENVIRONMENT_ID"
 PROFILE_ENV_VAR = "APPCONFIG_PROFILE_ID"
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+@lru_cache(maxsize=None)
+def _appconfig_client(region_name: str):
+    """Return the process-wide AppConfig Data client for ``region_name``."""
+
+    import boto3  # deferred: only AppConfig-backed services need it
+
+    return boto3.client("appconfigdata", region_name=region_name)
+
 
 class FeatureFlagService:
     """Fetch and cache feature flags from AWS AppConfig or a local JSON file.
@@ -64,13 +81,15 @@ class FeatureFlagService:
                 which is ideal for local development and tests. When absent the
                 service polls AWS AppConfig in ``ap-south-1`` every 45 seconds.
                 The default file path is ignored by Git and should only exist in
-                local environments.
+                local environments. The source is chosen once here; call
+                :meth:`reload` to pick up a file created afterwards.
         """
 
         self.ttl: int = DEFAULT_TTL_SECONDS
         self._token: Optional[str] = None
-        self._cache: Dict[str, Any] = {}
+        self._cache: Dict[str, bool] = {}
         self._last_refresh: Optional[float] = None
+        self._local_signature: Optional[Tuple[int, int]] = None
 
         if local_path is not None:
             self._local_path = Path(local_path)
@@ -81,26 +100,63 @@ class FeatureFlagService:
         self._environment_id: Optional[str] = os.getenv(ENVIRONMENT_ENV_VAR)
         self._profile_id: Optional[str] = os.getenv(PROFILE_ENV_VAR)
         self._client = None
+        self._source: str = self._detect_source()
 
-    def _refresh(self) -> None:
-        """Refresh the cached feature flags if the 45-second TTL has expired."""
+    def _detect_source(self) -> str:
+        """Return ``"local"`` when the flags file exists, otherwise ``"appconfig"``."""
 
-        now = time.monotonic()
-        if self._last_refresh is not None and now - self._last_refresh < self.ttl:
-            logger.debug(
-                "Feature flags refreshed within %s seconds, skipping refresh", self.ttl
-            )
-            return
+        return "local" if os.path.isfile(self._local_path) else "appconfig"
+
+    def reload(self) -> None:
+        """Re-detect the flag source and refresh the cache immediately."""
+
+        self._source = self._detect_source()
+        self._local_signature = None
+        self._refresh(time.monotonic())
+
+    def _store(self, payload: Dict[str, Any]) -> None:
+        """Cache the boolean flags from ``payload``, warning about any other values.
+
+        Keys are interned so lookups with interned names (identifier-like
+        literals) match on identity before falling back to string comparison.
+        """
+
+        flags: Dict[str, bool] = {}
+        for name, value in payload.items():
+            if isinstance(value, bool):
+                flags[sys.intern(name)] = value
+            else:
+                logger.warning(
+                    "Feature flag %s contains non-boolean value %r; lookups fall back to the default",
+                    name,
+                    value,
+                )
+        self._cache = flags
+
+    def _refresh(self, now: float) -> None:
+        """Reload the cached feature flags from the configured source."""
 
         try:
-            if self._local_path.exists():  # local mock
-                with self._local_path.open("r", encoding="utf-8") as handle:
-                    self._cache = json.load(handle)
+            if self._source == "local":  # local mock
+                try:
+                    stat = os.stat(self._local_path)
+                except FileNotFoundError:
+                    logger.warning(
+                        "Feature flags file %s was removed; switching to AppConfig",
+                        self._local_path,
+                    )
+                    self._source = "appconfig"
+                    self._local_signature = None
+                    self._refresh(now)
+                    return
+
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if signature != self._local_signature:
+                    self._store(_json_loads(self._local_path.read_bytes()))
+                    self._local_signature = signature
             else:  # real AWS
                 if self._client is None:
-                    self._client = boto3.client(
-                        "appconfigdata", region_name=DEFAULT_REGION
-                    )
+                    self._client = _appconfig_client(DEFAULT_REGION)
 
                 if not all(
                     [self._application_id, self._environment_id, self._profile_id]
@@ -160,7 +216,7 @@ class FeatureFlagService:
                 body = resp.get("Configuration")
                 raw = body.read() if hasattr(body, "read") else (body or b"")
                 if raw:
-                    self._cache = json.loads(raw.decode("utf-8"))
+                    self._store(_json_loads(raw))
         except (ClientError, BotoCoreError, OSError, json.JSONDecodeError) as exc:
             logger.error("Failed to refresh feature flags: %s", exc)
         finally:
@@ -169,18 +225,26 @@ class FeatureFlagService:
     def is_on(self, name: str, default: bool = False) -> bool:
         """Return the status of a feature flag, falling back to ``default`` when missing."""
 
-        self._refresh()
-        value = self._cache.get(name, default)
-        if isinstance(value, bool):
-            return value
-
-        logger.warning(
-            "Feature flag %s contains non-boolean value %r; falling back to %s",
-            name,
-            value,
-            default,
-        )
-        return bool(default)
+        now = time.monotonic()
+        if self._last_refresh is None or now - self._last_refresh >= self.ttl:
+            self._refresh(now)
+
+        return self._cache.get(name, bool(default))
+
+    def are_on(self, names: Iterable[str], default: bool = False) -> Dict[str, bool]:
+        """Return the status of several feature flags with a single TTL check.
+
+        Prefer this over repeated :meth:`is_on` calls when a request handler
+        reads many flags at once.
+        """
+
+        now = time.monotonic()
+        if self._last_refresh is None or now - self._last_refresh >= self.ttl:
+            self._refresh(now)
+
+        cache = self._cache
+        default = bool(default)
+        return {name: cache.get(name, default) for name in names}
 
 
 @contextmanager
@@ -1,3 +1,11 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _prefix(uc_uuid: str, file_category: str) -> str:
+    return f"{uc_uuid}/{file_category}/"
+
+
 def filepath_generator(file_uuid: str, file_category: str, uc_uuid: str) -> str:
     # Validate inputs
     if not file_uuid:
@@ -8,4 +16,4 @@ def filepath_generator(file_uuid: str, file_category: str, uc_uuid: str) -> str:
         raise ValueError("uc_uuid cannot be empty")
 
     # Generate path
-    return f"{uc_uuid}/{file_category}/{file_uuid}"
+    return f"{_prefix(uc_uuid, file_category)}{file_uuid}"
@@ -1,16 +1,29 @@
+import re
 import uuid
+from typing import Union
+
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
+
+def _is_valid_uuid(value: Union[str, uuid.UUID]) -> bool:
+    return isinstance(value, uuid.UUID) or bool(_UUID_RE.match(value))
 
 
 def generate_s3uri(
-    bucket_name: str, uc_uuid: str, file_category: str, file_uuid: str
+    bucket_name: str,
+    uc_uuid: Union[str, uuid.UUID],
+    file_category: str,
+    file_uuid: Union[str, uuid.UUID],
 ) -> str:
     """Generate an S3 URI from the given components.
 
     Args:
         bucket_name: Name of the S3 bucket
-        uc_uuid: UUID of the use case
+        uc_uuid: UUID of the use case, as a string or ``uuid.UUID``
         file_category: Category of the file
-        file_uuid: UUID of the file
+        file_uuid: UUID of the file, as a string or ``uuid.UUID``
 
     Returns:
         str: Generated S3 URI
@@ -23,10 +36,7 @@ def generate_s3uri(
     if not file_category:
         raise ValueError("File category cannot be empty")
 
-    try:
-        uuid.UUID(uc_uuid)
-        uuid.UUID(file_uuid)
-    except ValueError:
+    if not _is_valid_uuid(uc_uuid) or not _is_valid_uuid(file_uuid):
         raise ValueError("Invalid UUID format")
 
     return f"s3://{bucket_name}/{uc_uuid}/{file_category}/{file_uuid}"
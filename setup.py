@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "boto3",
+        "orjson",
         "tenacity",
         "googleapis-common-protos>=1.63.0",
     ],
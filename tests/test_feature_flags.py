@@ -5,7 +5,14 @@ from pathlib import Path
 
 import pytest
 
-from korefi_commons.feature_flags import FeatureFlagService
+from korefi_commons.feature_flags import FeatureFlagService, _appconfig_client
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    _appconfig_client.cache_clear()
+    yield
+    _appconfig_client.cache_clear()
 
 
 @pytest.fixture()
@@ -29,20 +36,62 @@ def test_ttl_skips_repeated_reads(
 ) -> None:
     service = FeatureFlagService(local_path=str(local_flags_file))
 
-    open_calls = 0
-    original_open = Path.open
+    read_calls = 0
+    original_read_bytes = Path.read_bytes
 
-    def counting_open(self: Path, *args, **kwargs):
-        nonlocal open_calls
+    def counting_read_bytes(self: Path):
+        nonlocal read_calls
         if self == Path(local_flags_file):
-            open_calls += 1
-        return original_open(self, *args, **kwargs)
+            read_calls += 1
+        return original_read_bytes(self)
 
-    monkeypatch.setattr("korefi_commons.feature_flags.Path.open", counting_open)
+    monkeypatch.setattr(
+        "korefi_commons.feature_flags.Path.read_bytes", counting_read_bytes
+    )
 
     assert service.is_on("enabled") is True
     assert service.is_on("enabled") is True
-    assert open_calls == 1
+    assert read_calls == 1
+
+
+def test_are_on_reads_multiple_flags(local_flags_file: Path) -> None:
+    service = FeatureFlagService(local_path=str(local_flags_file))
+
+    assert service.are_on(["enabled", "missing", "absent"]) == {
+        "enabled": True,
+        "missing": False,
+        "absent": False,
+    }
+    assert service.are_on(["absent"], default=True) == {"absent": True}
+
+
+def test_unchanged_file_not_reparsed_after_ttl(
+    monkeypatch: pytest.MonkeyPatch, local_flags_file: Path
+) -> None:
+    service = FeatureFlagService(local_path=str(local_flags_file))
+
+    time_values = iter([100.0, 146.0])
+    monkeypatch.setattr(
+        "korefi_commons.feature_flags.time.monotonic",
+        lambda: next(time_values),
+    )
+
+    read_calls = 0
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self: Path):
+        nonlocal read_calls
+        if self == Path(local_flags_file):
+            read_calls += 1
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(
+        "korefi_commons.feature_flags.Path.read_bytes", counting_read_bytes
+    )
+
+    assert service.is_on("enabled") is True
+    assert service.is_on("enabled") is True
+    assert read_calls == 1
 
 
 def test_missing_flag_returns_default(local_flags_file: Path) -> None:
@@ -51,6 +100,13 @@ def test_missing_flag_returns_default(local_flags_file: Path) -> None:
     assert service.is_on("does-not-exist", default=True) is True
 
 
+def test_missing_flag_coerces_default_to_bool(local_flags_file: Path) -> None:
+    service = FeatureFlagService(local_path=str(local_flags_file))
+
+    assert service.is_on("does-not-exist", default=None) is False
+    assert service.are_on(["does-not-exist"], default=1) == {"does-not-exist": True}
+
+
 def test_non_boolean_value_logs_warning(
     tmp_path: Path, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -65,6 +121,19 @@ def test_non_boolean_value_logs_warning(
     assert any("non-boolean" in message for message in caplog.messages)
 
 
+def test_invalid_json_logs_error_and_returns_default(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    file_path = tmp_path / "feature-flags.json"
+    file_path.write_text("{not json", encoding="utf-8")
+    service = FeatureFlagService(local_path=str(file_path))
+
+    with caplog.at_level(logging.ERROR):
+        assert service.is_on("anything", default=True) is True
+
+    assert any("Failed to refresh feature flags" in m for m in caplog.messages)
+
+
 def test_appconfig_fetch_when_local_missing(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -100,7 +169,7 @@ def test_appconfig_fetch_when_local_missing(
         return fake_client
 
     monkeypatch.setattr(
-        "korefi_commons.feature_flags.boto3.client",
+        "boto3.client",
         fake_boto3_client,
     )
 
@@ -132,3 +201,128 @@ def test_ttl_refresh_after_expiry(
 
     assert service.is_on("switch") is True
     assert service.is_on("switch") is False
+
+
+def test_reload_detects_new_local_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    for env_var in (
+        "APPCONFIG_APPLICATION_ID",
+        "APPCONFIG_ENVIRONMENT_ID",
+        "APPCONFIG_PROFILE_ID",
+    ):
+        monkeypatch.delenv(env_var, raising=False)
+    monkeypatch.setattr(
+        "boto3.client",
+        lambda service_name, region_name: object(),
+    )
+    file_path = tmp_path / "feature-flags.json"
+    service = FeatureFlagService(local_path=str(file_path))
+
+    assert service.is_on("late") is False
+
+    file_path.write_text(json.dumps({"late": True}), encoding="utf-8")
+    assert service.is_on("late") is False
+
+    service.reload()
+    assert service.is_on("late") is True
+
+
+def test_non_boolean_value_warns_once_per_refresh(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    file_path = tmp_path / "feature-flags.json"
+    file_path.write_text(json.dumps({"weird": "yes"}), encoding="utf-8")
+    service = FeatureFlagService(local_path=str(file_path))
+
+    with caplog.at_level(logging.WARNING):
+        assert service.is_on("weird") is False
+        assert service.is_on("weird", default=True) is True
+
+    assert sum("non-boolean" in message for message in caplog.messages) == 1
+
+
+def test_appconfig_reuses_poll_token_and_keeps_flags_on_empty_body(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    responses = iter(
+        [
+            {
+                "NextPollConfigurationToken": "token-2",
+                "Configuration": io.BytesIO(b'{"remote": true}'),
+            },
+            {
+                "NextPollConfigurationToken": "token-3",
+                "Configuration": io.BytesIO(b""),
+            },
+        ]
+    )
+
+    class FakeAppConfigClient:
+        def __init__(self) -> None:
+            self.start_calls = 0
+            self.tokens = []
+
+        def start_configuration_session(self, **kwargs):
+            self.start_calls += 1
+            return {"InitialConfigurationToken": "token-1"}
+
+        def get_latest_configuration(self, ConfigurationToken: str):
+            self.tokens.append(ConfigurationToken)
+            return next(responses)
+
+    fake_client = FakeAppConfigClient()
+
+    monkeypatch.setenv("APPCONFIG_APPLICATION_ID", "app")
+    monkeypatch.setenv("APPCONFIG_ENVIRONMENT_ID", "env")
+    monkeypatch.setenv("APPCONFIG_PROFILE_ID", "profile")
+    monkeypatch.setattr("boto3.client", lambda service_name, region_name: fake_client)
+    # tenacity also reads time.monotonic, so use a clock the test advances explicitly.
+    clock = [100.0]
+    monkeypatch.setattr(
+        "korefi_commons.feature_flags.time.monotonic",
+        lambda: clock[0],
+    )
+
+    service = FeatureFlagService(local_path=str(tmp_path / "feature-flags.json"))
+
+    assert service.is_on("remote") is True
+    clock[0] = 146.0
+    assert service.is_on("remote") is True
+    assert fake_client.start_calls == 1
+    assert fake_client.tokens == ["token-1", "token-2"]
+
+
+def test_switches_to_appconfig_when_local_file_removed(
+    monkeypatch: pytest.MonkeyPatch, local_flags_file: Path
+) -> None:
+    class FakeAppConfigClient:
+        def start_configuration_session(self, **kwargs):
+            return {"InitialConfigurationToken": "token"}
+
+        def get_latest_configuration(self, ConfigurationToken: str):
+            return {
+                "NextPollConfigurationToken": "next-token",
+                "Configuration": io.BytesIO(b'{"enabled": false, "remote": true}'),
+            }
+
+    monkeypatch.setenv("APPCONFIG_APPLICATION_ID", "app")
+    monkeypatch.setenv("APPCONFIG_ENVIRONMENT_ID", "env")
+    monkeypatch.setenv("APPCONFIG_PROFILE_ID", "profile")
+    monkeypatch.setattr(
+        "boto3.client", lambda service_name, region_name: FakeAppConfigClient()
+    )
+    # tenacity also reads time.monotonic, so use a clock the test advances explicitly.
+    clock = [100.0]
+    monkeypatch.setattr(
+        "korefi_commons.feature_flags.time.monotonic",
+        lambda: clock[0],
+    )
+
+    service = FeatureFlagService(local_path=str(local_flags_file))
+    assert service.is_on("enabled") is True
+
+    local_flags_file.unlink()
+    clock[0] = 146.0
+
+    assert service.are_on(["enabled", "remote"]) == {"enabled": False, "remote": True}
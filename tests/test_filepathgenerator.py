@@ -1,5 +1,7 @@
+import uuid
+
 import pytest
-from korefi_commons.filepath_generator import filepath_generator
+from korefi_commons.filepath_generator import _prefix, filepath_generator
 
 
 def test_filepath_generator():
@@ -23,3 +25,22 @@ def test_filepath_generator_empty_values():
 
     with pytest.raises(ValueError):
         filepath_generator(file_uuid="abc123", file_category="images", uc_uuid="")
+
+
+def test_filepath_generator_reuses_cached_prefix():
+    _prefix.cache_clear()
+
+    assert filepath_generator(file_uuid="a", file_category="docs", uc_uuid="uc") == "uc/docs/a"
+    assert filepath_generator(file_uuid="b", file_category="docs", uc_uuid="uc") == "uc/docs/b"
+
+    info = _prefix.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_filepath_generator_accepts_uuid_file_uuid():
+    file_uuid = uuid.uuid4()
+
+    assert (
+        filepath_generator(file_uuid=file_uuid, file_category="bill", uc_uuid="uc")
+        == f"uc/bill/{file_uuid}"
+    )
@@ -1,30 +1,91 @@
+import io
+import math
+import subprocess
+import sys
 import pytest
 import json
 from unittest.mock import patch
-from botocore.exceptions import ClientError
-from korefi_commons.s3 import S3Service, S3UploadError, S3DownloadError
+from botocore.exceptions import ClientError, EndpointConnectionError
+from korefi_commons.s3 import S3Service, S3UploadError, S3DownloadError, _make_s3_client
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    _make_s3_client.cache_clear()
+    yield
+    _make_s3_client.cache_clear()
 
 
 @pytest.fixture
 def s3_service():
-    with patch("korefi_commons.s3.boto3.client") as mock_client:
+    with patch("boto3.client") as mock_client:
         config = {"bucket_name": "test-bucket", "region_name": "us-east-1"}
         service = S3Service(config)
         service.s3_client = mock_client.return_value
         return service
 
 
+def test_module_import_does_not_load_boto3():
+    code = "import sys, korefi_commons.s3; assert 'boto3' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_s3_client_shared_across_services():
+    with patch("boto3.client") as mock_client:
+        config = {"bucket_name": "test-bucket", "region_name": "us-east-1"}
+        first = S3Service(config)
+        second = S3Service({**config, "bucket_name": "other-bucket"})
+
+    assert first.s3_client is second.s3_client
+    mock_client.assert_called_once()
+
+
+def test_s3_client_uses_botocore_adaptive_retries():
+    with patch("boto3.client") as mock_client:
+        S3Service({"bucket_name": "test-bucket", "max_retries": 5})
+
+    boto_config = mock_client.call_args.kwargs["config"]
+    assert boto_config.retries == {"total_max_attempts": 5, "mode": "adaptive"}
+    assert boto_config.max_pool_connections == 50
+
+
+def test_s3_client_max_pool_connections_configurable():
+    with patch("boto3.client") as mock_client:
+        S3Service({"bucket_name": "test-bucket", "max_pool_connections": 128})
+
+    assert mock_client.call_args.kwargs["config"].max_pool_connections == 128
+
+
 def test_upload_json_success(s3_service):
     data = {"test": "data"}
     file_key = "test/file.json"
 
     assert s3_service.upload_json(data, file_key) is True
-    s3_service.s3_client.put_object.assert_called_once_with(
-        Bucket="test-bucket",
-        Key=file_key,
-        Body=json.dumps(data),
-        Metadata={"ContentType": "application/json", "NumberOfRetries": "0"},
-    )
+    s3_service.s3_client.put_object.assert_called_once()
+    kwargs = s3_service.s3_client.put_object.call_args.kwargs
+    assert kwargs["Bucket"] == "test-bucket"
+    assert kwargs["Key"] == file_key
+    assert isinstance(kwargs["Body"], bytes)
+    assert json.loads(kwargs["Body"]) == data
+    assert kwargs["ContentLength"] == len(kwargs["Body"])
+    assert kwargs["ContentType"] == "application/json"
+    assert "Metadata" not in kwargs
+
+
+def test_upload_json_non_string_keys(s3_service):
+    assert s3_service.upload_json({1: "a", 2: "b"}, "test/file.json") is True
+
+    body = s3_service.s3_client.put_object.call_args.kwargs["Body"]
+    assert json.loads(body) == {"1": "a", "2": "b"}
+
+
+def test_upload_json_large_int_falls_back_to_json(s3_service):
+    data = {"amount": 2**70}
+
+    assert s3_service.upload_json(data, "test/file.json") is True
+
+    body = s3_service.s3_client.put_object.call_args.kwargs["Body"]
+    assert json.loads(body) == data
 
 
 def test_upload_json_client_error(s3_service):
@@ -33,20 +94,41 @@ def test_upload_json_client_error(s3_service):
         error_response, "PutObject"
     )
 
-    with pytest.raises(S3UploadError):
+    with pytest.raises(S3UploadError, match="500: Test error") as excinfo:
         s3_service.upload_json({"test": "data"}, "test/file.json")
 
+    assert isinstance(excinfo.value.__cause__, ClientError)
+
 
 def test_download_file_success(s3_service):
     file_key = "test/file.pdf"
     local_path = "/tmp/test.pdf"
-    s3_service.s3_client.list_objects_v2.return_value = {
-        "Contents": [{"Key": file_key}]
-    }
 
     assert s3_service.download_file(file_key, local_path) is True
     s3_service.s3_client.download_file.assert_called_once_with(
-        "test-bucket", file_key, local_path
+        "test-bucket", file_key, local_path, Config=s3_service._transfer_config
+    )
+    s3_service.s3_client.list_objects_v2.assert_not_called()
+    s3_service.s3_client.head_object.assert_not_called()
+
+
+def test_download_file_resolves_extensionless_key(s3_service):
+    prefix = "test/file"
+    local_path = "/tmp/test.pdf"
+    s3_service.s3_client.download_file.side_effect = [
+        ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"),
+        None,
+    ]
+    s3_service.s3_client.list_objects_v2.return_value = {
+        "Contents": [{"Key": "test/file.pdf"}]
+    }
+
+    assert s3_service.download_file(prefix, local_path) is True
+    s3_service.s3_client.list_objects_v2.assert_called_once_with(
+        Bucket="test-bucket", Prefix=prefix, MaxKeys=1
+    )
+    s3_service.s3_client.download_file.assert_called_with(
+        "test-bucket", "test/file.pdf", local_path, Config=s3_service._transfer_config
     )
 
 
@@ -60,6 +142,69 @@ def test_download_file_not_found(s3_service):
         s3_service.download_file("test/nonexistent.pdf", "/tmp/test.pdf")
 
 
+def test_download_json_success(s3_service):
+    s3_service.s3_client.get_object.return_value = {
+        "Body": io.BytesIO(b'{"test": "data"}')
+    }
+
+    assert s3_service.download_json("s3://test-bucket/test/file.json") == {
+        "test": "data"
+    }
+    s3_service.s3_client.get_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test/file.json"
+    )
+
+
+def test_download_json_reads_legacy_nan_payload(s3_service):
+    s3_service.s3_client.get_object.return_value = {
+        "Body": io.BytesIO(b'{"amount": NaN}')
+    }
+
+    result = s3_service.download_json("s3://test-bucket/test/file.json")
+
+    assert math.isnan(result["amount"])
+
+
+def test_download_json_rejects_other_bucket(s3_service):
+    with pytest.raises(S3DownloadError):
+        s3_service.download_json("s3://other-bucket/test/file.json")
+
+    s3_service.s3_client.get_object.assert_not_called()
+
+
+def test_download_many_fetches_every_pair(s3_service):
+    pairs = [("test/a.pdf", "/tmp/a.pdf"), ("test/b.pdf", "/tmp/b.pdf")]
+
+    assert s3_service.download_many(pairs, max_workers=2) == [True, True]
+    calls = s3_service.s3_client.download_file.call_args_list
+    downloaded = {call.args[:3] for call in calls}
+    assert downloaded == {("test-bucket", key, path) for key, path in pairs}
+    assert all(call.kwargs["Config"].max_concurrency == 1 for call in calls)
+
+
+def test_download_many_json(s3_service):
+    bodies = {
+        "test/a.json": b'{"name": "a"}',
+        "test/b.json": b'{"name": "b"}',
+    }
+    s3_service.s3_client.get_object.side_effect = lambda Bucket, Key: {
+        "Body": io.BytesIO(bodies[Key])
+    }
+
+    assert s3_service.download_many_json(
+        ["s3://test-bucket/test/a.json", "s3://test-bucket/test/b.json"]
+    ) == [{"name": "a"}, {"name": "b"}]
+
+
+def test_download_many_raises_on_failure(s3_service):
+    s3_service.s3_client.download_file.side_effect = ClientError(
+        {"Error": {"Code": "403", "Message": "Forbidden"}}, "GetObject"
+    )
+
+    with pytest.raises(S3DownloadError):
+        s3_service.download_many([("test/a.pdf", "/tmp/a.pdf")])
+
+
 def test_check_file_exists(s3_service):
     s3_service.s3_client.head_object.return_value = {}
     assert s3_service.check_file_exists("test/file.pdf") is True
@@ -68,15 +213,56 @@ def test_check_file_exists(s3_service):
         {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
     )
     assert s3_service.check_file_exists("test/nonexistent.pdf") is False
-    
+
+
+def test_get_if_changed_returns_new_body(s3_service):
+    s3_service.s3_client.get_object.return_value = {
+        "Body": io.BytesIO(b"payload"),
+        "ETag": '"new"',
+    }
+
+    assert s3_service.get_if_changed("test/file.json", '"old"') == (b"payload", '"new"')
+    s3_service.s3_client.get_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test/file.json", IfNoneMatch='"old"'
+    )
+
+
+def test_get_if_changed_not_modified(s3_service):
+    s3_service.s3_client.get_object.side_effect = ClientError(
+        {"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject"
+    )
+
+    assert s3_service.get_if_changed("test/file.json", '"same"') == (None, '"same"')
+
+
+def test_get_if_changed_client_error(s3_service):
+    s3_service.s3_client.get_object.side_effect = ClientError(
+        {"Error": {"Code": "403", "Message": "Forbidden"}}, "GetObject"
+    )
+
+    with pytest.raises(S3DownloadError):
+        s3_service.get_if_changed("test/file.json", '"same"')
+
+
+def test_get_if_changed_connection_error(s3_service):
+    s3_service.s3_client.get_object.side_effect = EndpointConnectionError(
+        endpoint_url="https://s3.amazonaws.com"
+    )
+
+    with pytest.raises(S3DownloadError) as excinfo:
+        s3_service.get_if_changed("test/file.json", '"same"')
+
+    assert isinstance(excinfo.value.__cause__, EndpointConnectionError)
+
+
 def test_upload_xml_success(s3_service):
     xml_data = "<root><element>Test</element></root>"
     file_key = "test/file.xml"
- 
+
     assert s3_service.upload_xml(xml_data, file_key) is True
     s3_service.s3_client.put_object.assert_called_once_with(
         Bucket="test-bucket",
         Key=file_key,
         Body=xml_data,
-        Metadata={"ContentType": "application/xml", "NumberOfRetries": "0"},
-    )
\ No newline at end of file
+        ContentType="application/xml",
+    )
@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from korefi_commons.s3uri_generator import generate_s3uri
 
@@ -42,3 +44,23 @@ def test_generate_s3uri_with_invalid_uuid():
 
     with pytest.raises(ValueError):
         generate_s3uri(bucket_name, uc_uuid, file_category, file_uuid)
+
+
+def test_generate_s3uri_requires_canonical_uuid():
+    bucket_name = "test-bucket"
+    uc_uuid = "123e4567e89b12d3a456426614174000"
+    file_category = "documents"
+    file_uuid = "987fcdeb-51a2-43d7-9876-543210987654"
+
+    with pytest.raises(ValueError):
+        generate_s3uri(bucket_name, uc_uuid, file_category, file_uuid)
+
+
+def test_generate_s3uri_accepts_uuid_objects():
+    uc_uuid = uuid.UUID("123e4567-e89b-12d3-a456-426614174000")
+    file_uuid = uuid.UUID("987fcdeb-51a2-43d7-9876-543210987654")
+
+    assert (
+        generate_s3uri("test-bucket", uc_uuid, "documents", file_uuid)
+        == f"s3://test-bucket/{uc_uuid}/documents/{file_uuid}"
+    )